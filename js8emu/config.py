@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import configparser
+import re
+from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Optional
 
 
 @dataclass(frozen=True)
@@ -32,6 +36,62 @@ class ConfigError(ValueError):
     pass
 
 
+# Surrounding whitespace and one optional pair of quotes, e.g. callsign = "2E0FGO"
+_STRIP_RE = re.compile(r'^\s*[\'"]?(.*?)[\'"]?\s*$', re.DOTALL)
+
+
+def _clean(v: str) -> str:
+    return _STRIP_RE.match(v).group(1)
+
+
+def _to_bool(v: str) -> bool:
+    # Same spellings as ConfigParser.getboolean (1/yes/true/on, 0/no/false/off)
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[v.strip().lower()]
+    except KeyError:
+        raise ValueError(f"not a boolean: {v!r}") from None
+
+
+# (key, converter, check, rule) for each required key, validated in one pass per section.
+# check/rule are None when the converter alone rejects bad values.
+_FieldSpec = tuple[str, Callable[[str], Any], Optional[Callable[[Any], bool]], Optional[str]]
+
+_GENERAL_FIELDS: tuple[_FieldSpec, ...] = (
+    ("fragment_size", int, lambda v: v > 0, "fragment_size must be > 0"),
+    ("frame_time", float, lambda v: v >= 0, "frame_time must be >= 0"),
+    ("shift_to_upper", _to_bool, None, None),
+)
+
+_INTERFACE_FIELDS: tuple[_FieldSpec, ...] = (
+    ("port", int, lambda v: 0 < v <= 65535, "port out of range"),
+    ("callsign", _clean, bool, "callsign must be non-empty"),
+    ("frequency", int, lambda v: v > 0, "frequency must be > 0"),
+    # offset can be 0, but keep simple sanity check
+    ("offset", int, lambda v: abs(v) <= 200000, "offset seems unreasonable"),
+    ("maidenhead", _clean, bool, "maidenhead must be non-empty"),
+)
+
+
+def _read_section(section: configparser.SectionProxy, fields: tuple[_FieldSpec, ...]) -> dict[str, Any]:
+    """Convert and check every field of ``section``, raising ConfigError on the first problem."""
+    values: dict[str, Any] = {}
+    for key, convert, check, rule in fields:
+        try:
+            value = convert(section[key])
+        except KeyError as e:
+            raise ConfigError(f"Missing [{section.name}] key: {e}") from e
+        except ValueError as e:
+            raise ConfigError(f"Invalid [{section.name}] value: {e}") from e
+        if check is not None and not check(value):
+            raise ConfigError(f"[{section.name}] {rule}: {value!r}")
+        values[key] = value
+    return values
+
+
+def _duplicates(values: list[Any]) -> list[Any]:
+    return [v for v, n in Counter(values).items() if n > 1]
+
+
 def load_config(path: str | Path) -> AppConfig:
     path = Path(path)
     if not path.exists():
@@ -43,72 +103,23 @@ def load_config(path: str | Path) -> AppConfig:
     if "general" not in cp:
         raise ConfigError("Missing [general] section")
 
-    try:
-        fragment_size = int(cp["general"]["fragment_size"])
-        frame_time = float(cp["general"]["frame_time"])
-        shift_to_upper = bool(cp["general"]["shift_to_upper"])
-    except KeyError as e:
-        raise ConfigError(f"Missing [general] key: {e}") from e
-    except ValueError as e:
-        raise ConfigError(f"Invalid [general] value: {e}") from e
-
-    if fragment_size <= 0:
-        raise ConfigError("[general] fragment_size must be > 0")
-    if frame_time < 0:
-        raise ConfigError("[general] frame_time must be >= 0")
-
-    interfaces: list[InterfaceConfig] = []
-    for section in cp.sections():
-        if not section.startswith("interface_"):
-            continue
-        s = cp[section]
-        try:
-            port = int(s["port"])
-            callsign = str(s["callsign"]).strip().strip('"').strip("'")
-            frequency = int(s["frequency"])
-            offset = int(s["offset"])
-            maidenhead = str(s["maidenhead"]).strip().strip('"').strip("'")
-        except KeyError as e:
-            raise ConfigError(f"Missing [{section}] key: {e}") from e
-        except ValueError as e:
-            raise ConfigError(f"Invalid [{section}] value: {e}") from e
-
-        if not callsign:
-            raise ConfigError(f"[{section}] callsign must be non-empty")
-        if port <= 0 or port > 65535:
-            raise ConfigError(f"[{section}] port out of range: {port}")
-        if frequency <= 0:
-            raise ConfigError(f"[{section}] frequency must be > 0")
-        # offset can be 0, but keep simple sanity check
-        if abs(offset) > 200000:
-            raise ConfigError(f"[{section}] offset seems unreasonable: {offset}")
-        if not maidenhead:
-            raise ConfigError(f"[{section}] maidenhead must be non-empty")
-
-        interfaces.append(
-            InterfaceConfig(
-                name=section,
-                port=port,
-                callsign=callsign,
-                frequency=frequency,
-                offset=offset,
-                maidenhead=maidenhead,
-            )
-        )
+    general = GeneralConfig(**_read_section(cp["general"], _GENERAL_FIELDS))
 
+    interfaces = [
+        InterfaceConfig(name=section, **_read_section(cp[section], _INTERFACE_FIELDS))
+        for section in cp.sections()
+        if section.startswith("interface_")
+    ]
     if not interfaces:
         raise ConfigError("No [interface_N] sections found")
 
     # Startup validation: duplicate ports/callsigns => immediate failure
-    ports = [i.port for i in interfaces]
-    if len(set(ports)) != len(ports):
-        raise ConfigError("Duplicate interface port detected; ports must be unique")
-
-    calls = [i.callsign.upper() for i in interfaces]
-    if len(set(calls)) != len(calls):
-        raise ConfigError("Duplicate interface callsign detected; callsigns must be unique")
-
-    return AppConfig(
-        general=GeneralConfig(fragment_size=fragment_size, frame_time=frame_time, shift_to_upper=shift_to_upper),
-        interfaces=interfaces,
-    )
+    dup_ports = _duplicates([i.port for i in interfaces])
+    if dup_ports:
+        raise ConfigError(f"Duplicate interface port detected; ports must be unique: {dup_ports}")
+
+    dup_calls = _duplicates([i.callsign.upper() for i in interfaces])
+    if dup_calls:
+        raise ConfigError(f"Duplicate interface callsign detected; callsigns must be unique: {dup_calls}")
+
+    return AppConfig(general=general, interfaces=interfaces)
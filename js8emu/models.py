@@ -5,6 +5,8 @@ import threading
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .protocol import to_json
+
 
 @dataclass
 class Connection:
@@ -36,9 +38,25 @@ class InterfaceState:
     callsign: str
     maidenhead: str
     offset: int
-    frequency: int  # mutable
+    frequency: int  # mutable; change via set_frequency()
     listener: socket.socket
     conn: Optional[Connection] = None  # exactly one connection allowed
 
+    callsign_prefix: str = field(init=False, repr=False)  # "<callsign>: " on every TX payload
+    # Pre-encoded JSON fragments reused by every outbound message for this interface.
+    callsign_json: bytes = field(init=False, repr=False)
+    maidenhead_json: bytes = field(init=False, repr=False)
+    freq_params: bytes = field(init=False, repr=False)  # "DIAL":..,"FREQ":..,"OFFSET":..
+
+    def __post_init__(self) -> None:
+        self.callsign_prefix = f"{self.callsign}: "
+        self.callsign_json = to_json(self.callsign)
+        self.maidenhead_json = to_json(self.maidenhead)
+        self.set_frequency(self.frequency)
+
+    def set_frequency(self, frequency: int) -> None:
+        self.frequency = frequency
+        self.freq_params = b'"DIAL":%d,"FREQ":%d,"OFFSET":%d' % (frequency, frequency + self.offset, self.offset)
+
     def is_connected(self) -> bool:
         return self.conn is not None and not self.conn.closed
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; the standard library json is the baseline
+    orjson = None
+
+# orjson reads integers wider than 64 bits as floats, losing digits that must be
+# echoed back exactly (e.g. _ID). Lines with a 19+ digit run go through json.
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
 
 class ProtocolError(ValueError):
     pass
@@ -10,7 +20,10 @@ class ProtocolError(ValueError):
 
 def parse_json_line(line: bytes) -> dict[str, Any]:
     try:
-        obj = json.loads(line.decode("utf-8"))
+        if orjson and not _LONG_DIGITS_RE.search(line):
+            obj = orjson.loads(line)
+        else:
+            obj = json.loads(line.decode("utf-8"))
     except Exception as e:
         raise ProtocolError(f"Invalid JSON: {e}") from e
     if not isinstance(obj, dict):
@@ -18,14 +31,24 @@ def parse_json_line(line: bytes) -> dict[str, Any]:
     return obj
 
 
-def to_json_line(obj: dict[str, Any]) -> bytes:
-    # JS8Call examples look like compact JSON with \n terminator.
-    s = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
-    return (s + "\n").encode("utf-8")
+def to_json(obj: Any) -> bytes:
+    # Compact UTF-8 JSON for a single value; also used to fill pre-built message templates.
+    # orjson only takes strings (the bulky values), where its output matches json's
+    # byte for byte; it formats floats differently (0.00001 vs 1e-05) and rejects
+    # integers wider than 64 bits.
+    if orjson and isinstance(obj, str):
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 def fragment_text(payload: str, fragment_size: int) -> list[str]:
     # No padding. Fragment size is in characters (as per your examples); payload is already string.
     if fragment_size <= 0:
         return [payload]
-    return [payload[i:i + fragment_size] for i in range(0, len(payload), fragment_size)]
+    n = len(payload)
+    if n <= fragment_size:
+        # Short messages fit in a single frame; nothing to slice.
+        return [payload] if n else []
+    if fragment_size == 1:
+        return list(payload)
+    return [payload[i:i + fragment_size] for i in range(0, n, fragment_size)]
@@ -1,35 +1,66 @@
 from __future__ import annotations
 
 import logging
+import sys
 import threading
-import time
 from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 log = logging.getLogger("js8emu.scheduler")
 
+# ThreadPoolExecutor needs an int; this means "no cap" (see Scheduler.__init__).
+_UNBOUNDED = sys.maxsize
+
+# How long close() waits for running tasks to finish their abort path.
+_CLOSE_TIMEOUT = 1.0
+
 
 class Scheduler:
     """
     Very small helper to run delayed tasks without blocking the selector loop.
-    Uses threads as per your chosen concurrency model.
+    Uses threads as per your chosen concurrency model, drawn from an unbounded
+    pool so that long sessions reuse idle workers instead of starting a thread
+    per task, while no task ever waits for a free worker.
+
+    Pool workers are not daemon threads, so interpreter exit waits for running
+    tasks; close() makes them abort and waits up to _CLOSE_TIMEOUT for that.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int | None = None) -> None:
         self._closed = threading.Event()
-        self._threads: list[threading.Thread] = []
+        # A TX task holds its worker for the whole transmission (up to minutes), so
+        # by default the pool never queues: the executor reuses an idle worker when
+        # there is one and otherwise starts another, growing to peak concurrency.
+        if max_workers is None:
+            max_workers = _UNBOUNDED
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="js8emu")
+        # Submitted tasks that have not finished yet; close() waits on these.
+        self._pending: set[Future[None]] = set()
+        self._pending_lock = threading.Lock()
 
     def close(self) -> None:
         self._closed.set()
-        for t in list(self._threads):
-            t.join(timeout=1.0)
+        # Running tasks see the closed event and abort their frame sleeps. Wait for
+        # them so their abort path (e.g. RIG.PTT off) runs before callers tear down
+        # the sockets it writes to.
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._pending_lock:
+            pending = list(self._pending)
+        wait(pending, timeout=_CLOSE_TIMEOUT)
 
     def run_in_thread(self, fn: Callable[[], None], name: str) -> None:
         if self._closed.is_set():
             return
 
-        t = threading.Thread(target=self._wrap(fn), name=name, daemon=True)
-        self._threads.append(t)
-        t.start()
+        fut = self._pool.submit(self._safe_run, fn, name)
+        with self._pending_lock:
+            self._pending.add(fut)
+        # Runs immediately if the task already finished
+        fut.add_done_callback(self._forget)
+
+    def _forget(self, fut: Future[None]) -> None:
+        with self._pending_lock:
+            self._pending.discard(fut)
 
     def run_frame_sequence(
         self,
@@ -74,17 +105,11 @@ class Scheduler:
         """Returns False if scheduler closed while sleeping."""
         if seconds <= 0:
             return not self._closed.is_set()
-        end = time.time() + seconds
-        while time.time() < end:
-            if self._closed.is_set():
-                return False
-            time.sleep(min(0.05, end - time.time()))
-        return not self._closed.is_set()
-
-    def _wrap(self, fn: Callable[[], None]) -> Callable[[], None]:
-        def inner() -> None:
-            try:
-                fn()
-            except Exception:
-                log.exception("Scheduled task crashed")
-        return inner
+        return not self._closed.wait(timeout=seconds)
+
+    @staticmethod
+    def _safe_run(fn: Callable[[], None], name: str) -> None:
+        try:
+            fn()
+        except Exception:
+            log.exception("Scheduled task %s crashed", name)
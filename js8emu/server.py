@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import logging
+import os
 import selectors
 import socket
+import threading
+from collections import defaultdict
+from collections.abc import Callable
 from typing import Any
 
 from .config import AppConfig
 from .models import Connection, InterfaceState
-from .protocol import ProtocolError, fragment_text, parse_json_line, to_json_line
+from .protocol import ProtocolError, fragment_text, parse_json_line, to_json
 from .scheduler import Scheduler
 from .util import epoch_ms_times_1000, rand_snr, rand_tdrift, station_status_id
 
@@ -16,6 +20,58 @@ log = logging.getLogger("js8emu")
 # Maximum number of bytes to log for outbound payloads
 MAX_LOG_BYTES = 400
 
+# Pre-built outbound message shapes, filled with bytes %-formatting instead of
+# building a dict per message. Key order matches the JS8Call examples in the
+# spec; %b slots take to_json() output or the cached fragments on InterfaceState.
+_CALLSIGN_TPL = b'{"params":{"_ID":%b},"type":"STATION.CALLSIGN","value":%b}\n'
+_RIG_FREQ_TPL = b'{"params":{%b,"_ID":%b},"type":"RIG.FREQ","value":""}\n'
+_RX_ACTIVITY_TPL = (b'{"params":{%b,"SNR":%d,"SPEED":1,"TDRIFT":%b,"UTC":%d,"_ID":-1},'
+                    b'"type":"RX.ACTIVITY","value":%b}\n')
+_RX_DIRECTED_TPL = (b'{"params":{"CMD":" ","DIAL":%d,"EXTRA":"","FREQ":%d,"FROM":%b,"GRID":"","OFFSET":%d,'
+                    b'"SNR":%d,"SPEED":1,"TDRIFT":%b,"TEXT":%b,"TO":%b,"UTC":%d,"_ID":-1},'
+                    b'"type":"RX.DIRECTED","value":%b}\n')
+_RX_SPOT_TPL = (b'{"params":{"CALL":%b,"DIAL":%d,"FREQ":%d,"GRID":%b,"OFFSET":%d,"SNR":%d,"_ID":-1},'
+                b'"type":"RX.SPOT","value":""}\n')
+_STATION_STATUS_TPL = b'{"params":{%b,"SELECTED":"","SPEED":1,"_ID":"%d"},"type":"STATION.STATUS","value":""}\n'
+_RIG_PTT_ON_TPL = b'{"params":{"PTT":true,"UTC":%d,"_ID":-1},"type":"RIG.PTT","value":"on"}\n'
+_RIG_PTT_OFF_TPL = b'{"params":{"PTT":false,"UTC":%d,"_ID":-1},"type":"RIG.PTT","value":"off"}\n'
+
+
+class _Trunc:
+    """Log argument that truncates a payload only if the record is actually formatted."""
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: bytes | list[bytes]) -> None:
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        b = self.payload if isinstance(self.payload, bytes) else b"".join(self.payload)
+        return f"{b[:MAX_LOG_BYTES]!r}{'...' if len(b) > MAX_LOG_BYTES else ''}"
+
+
+# The loop blocks until there is socket activity or close() wakes it. Windows
+# only delivers Ctrl+C when select() returns, so it keeps a short timeout there.
+_SELECT_TIMEOUT = 0.5 if os.name == "nt" else None
+
+# socket.sendmsg is not available on Windows
+_HAVE_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+def _send_parts(sock: socket.socket, parts: list[bytes]) -> None:
+    """Send ``parts`` back to back, like sendall() on their concatenation."""
+    if not _HAVE_SENDMSG:
+        sock.sendall(b"".join(parts))
+        return
+    views = [memoryview(p) for p in parts]
+    while views:
+        sent = sock.sendmsg(views)
+        # Drop fully sent buffers and trim a partially sent one
+        while views and sent >= len(views[0]):
+            sent -= len(views.pop(0))
+        if sent:
+            views[0] = views[0][sent:]
+
 
 class JS8EmuServer:
     def __init__(self, cfg: AppConfig) -> None:
@@ -24,7 +80,32 @@ class JS8EmuServer:
         self.scheduler = Scheduler()
         self._closed = False
 
+        # Inbound message type -> handler; add new interactions here
+        self._handlers: dict[str, Callable[[str, dict[str, Any]], None]] = {
+            "STATION.GET_CALLSIGN": self._on_get_callsign,
+            "RIG.GET_FREQ": self._on_get_freq,
+            "RIG.SET_FREQ": self._on_set_freq,
+            "TX.SEND_MESSAGE": self._on_tx_send_message,
+        }
+
         self.interfaces: dict[str, InterfaceState] = {}
+        # Names of connected interfaces keyed by dial frequency, for TX fan-out.
+        # The lock keeps each bucket in step with iface.conn and iface.frequency,
+        # since TX threads may disconnect a client while the selector accepts one.
+        self._by_freq: defaultdict[int, set[str]] = defaultdict(set)
+        self._by_freq_lock = threading.Lock()
+        # fds registered with the selector; TX threads may disconnect clients too
+        self._registered: set[int] = set()
+        self._registered_lock = threading.Lock()
+
+        # close() writes to _wake_w so a blocked select() returns promptly
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._register(self._wake_r, ("wake", ""))
+        # Set whenever run_forever is not inside the selector loop
+        self._loop_stopped = threading.Event()
+        self._loop_stopped.set()
+        self._loop_thread_id: int | None = None
         for ic in cfg.interfaces:
             ls = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             ls.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -42,7 +123,7 @@ class JS8EmuServer:
                 listener=ls,
             )
             self.interfaces[ic.name] = state
-            self.sel.register(ls, selectors.EVENT_READ, data=("listener", ic.name))
+            self._register(ls, ("listener", ic.name))
             log.info("Listening %s on 127.0.0.1:%d callsign=%s dial=%d offset=%d grid=%s",
                      ic.name, ic.port, ic.callsign, ic.frequency, ic.offset, ic.maidenhead)
 
@@ -50,6 +131,14 @@ class JS8EmuServer:
         if self._closed:
             return
         self._closed = True
+        try:
+            self._wake_w.send(b"x")
+        except OSError:
+            pass
+        # A loop blocked in select() on another thread must see the wake-up before
+        # the selector and wake socket are torn down, or it would never return.
+        if self._loop_thread_id != threading.get_ident():
+            self._loop_stopped.wait(timeout=1.0)
 
         try:
             self.scheduler.close()
@@ -57,14 +146,14 @@ class JS8EmuServer:
             for iface in self.interfaces.values():
                 if iface.conn:
                     iface.conn.close()
-                try:
-                    self.sel.unregister(iface.listener)
-                except KeyError:
-                    pass
+                self._unregister(iface.listener)
                 try:
                     iface.listener.close()
                 except OSError:
                     pass
+            self._unregister(self._wake_r)
+            for s in (self._wake_r, self._wake_w):
+                s.close()
             try:
                 self.sel.close()
             except OSError:
@@ -72,17 +161,44 @@ class JS8EmuServer:
 
     def run_forever(self) -> None:
         log.info("JS8Emu running.")
-        while not self._closed:
-            events = self.sel.select(timeout=0.25)
-            for key, _mask in events:
-                kind, name = key.data
-                if kind == "listener":
-                    self._accept(name)
-                elif kind == "client":
-                    self._read_client(name)
+        self._loop_thread_id = threading.get_ident()
+        self._loop_stopped.clear()
+        try:
+            while not self._closed:
+                events = self.sel.select(timeout=_SELECT_TIMEOUT)
+                for key, _mask in events:
+                    kind, name = key.data
+                    if kind == "listener":
+                        self._accept(name)
+                    elif kind == "client":
+                        self._read_client(name)
+                    elif kind == "wake":
+                        self._drain_wake()
+        finally:
+            self._loop_thread_id = None
+            self._loop_stopped.set()
 
     # --- Socket handling ---
 
+    def _register(self, sock: socket.socket, data: tuple[str, str]) -> None:
+        with self._registered_lock:
+            self.sel.register(sock, selectors.EVENT_READ, data=data)
+            self._registered.add(sock.fileno())
+
+    def _unregister(self, sock: socket.socket) -> None:
+        fd = sock.fileno()
+        with self._registered_lock:
+            if fd in self._registered:
+                self._registered.remove(fd)
+                self.sel.unregister(sock)
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_r.recv(64):
+                pass
+        except OSError:
+            pass
+
     def _accept(self, iface_name: str) -> None:
         iface = self.interfaces[iface_name]
         try:
@@ -101,8 +217,10 @@ class JS8EmuServer:
             return
 
         c = Connection(sock=conn, addr=addr)
-        iface.conn = c
-        self.sel.register(conn, selectors.EVENT_READ, data=("client", iface_name))
+        with self._by_freq_lock:
+            iface.conn = c
+            self._by_freq[iface.frequency].add(iface_name)
+        self._register(conn, ("client", iface_name))
         log.info("%s accepted connection from %s", iface_name, addr)
 
     def _read_client(self, iface_name: str) -> None:
@@ -122,23 +240,16 @@ class JS8EmuServer:
 
         c.recv_buffer.extend(data)
 
-        # Process complete lines
-        while True:
-            nl = c.recv_buffer.find(b"\n")
-            if nl < 0:
-                break
-            line = bytes(c.recv_buffer[:nl])  # without newline
-            del c.recv_buffer[: nl + 1]
-
-            if log.isEnabledFor(logging.DEBUG):
-                shown = line[:MAX_LOG_BYTES]
-                suffix = b"..." if len(line) > MAX_LOG_BYTES else b""
-                log.debug(
-                    "RX ← %-12s %r%s",
-                    iface_name,
-                    shown,
-                    suffix,
-                )
+        # Earlier data never holds a newline, so only new data can complete a line
+        if b"\n" not in data:
+            return
+
+        # Process complete lines in one pass; the last chunk is the incomplete tail
+        *lines, tail = bytes(c.recv_buffer).split(b"\n")
+        c.recv_buffer[:] = tail
+
+        for line in lines:
+            log.debug("RX ← %-12s %r", iface_name, _Trunc(line))
 
             if not line.strip():
                 continue
@@ -153,27 +264,28 @@ class JS8EmuServer:
 
     def _disconnect(self, iface_name: str) -> None:
         iface = self.interfaces[iface_name]
-        c = iface.conn
-        iface.conn = None
+        with self._by_freq_lock:
+            self._leave_bucket(iface.frequency, iface_name)
+            c = iface.conn
+            iface.conn = None
         if c:
-            try:
-                self.sel.unregister(c.sock)
-            except KeyError:
-                pass
+            self._unregister(c.sock)
             c.close()
         log.info("%s disconnected.", iface_name)
 
-    def _safe_send(self, iface: InterfaceState, payload: bytes) -> None:
+    def _leave_bucket(self, frequency: int, iface_name: str) -> None:
+        # Caller holds _by_freq_lock. Empty buckets are dropped so repeated
+        # RIG.SET_FREQ changes don't leave one behind per frequency.
+        bucket = self._by_freq.get(frequency)
+        if bucket is not None:
+            bucket.discard(iface_name)
+            if not bucket:
+                del self._by_freq[frequency]
+
+    def _safe_send(self, iface: InterfaceState, payload: bytes | list[bytes]) -> None:
+        """Send ``payload`` to the interface's client; a list is sent as one write."""
         # Debug logging with payload truncation to avoid log spam
-        if log.isEnabledFor(logging.DEBUG):
-            shown = payload[:MAX_LOG_BYTES]
-            suffix = b"..." if len(payload) > MAX_LOG_BYTES else b""
-            log.debug(
-                "TX → %-12s %r%s",
-                iface.name,
-                shown,
-                suffix,
-            )
+        log.debug("TX → %-12s %r", iface.name, _Trunc(payload))
         c = iface.conn
         if c is None or c.closed:
             return
@@ -181,7 +293,10 @@ class JS8EmuServer:
             with c.send_lock:
                 if c.closed:
                     return
-                c.sock.sendall(payload)
+                if isinstance(payload, bytes):
+                    c.sock.sendall(payload)
+                else:
+                    _send_parts(c.sock, payload)
         except OSError:
             # treat as disconnect
             self._disconnect(iface.name)
@@ -192,44 +307,27 @@ class JS8EmuServer:
         Spec: RIG.PTT ON MUST be sent once the frame_time wait starts (per frame)
         and RIG.PTT OFF MUST be sent once a frame has been sent.
         """
-        msg = {
-            "params": {
-                "PTT": bool(is_on),
-                "UTC": epoch_ms_times_1000(),
-                "_ID": -1,
-            },
-            "type": "RIG.PTT",
-            "value": "on" if is_on else "off",
-        }
-        self._safe_send(sender, to_json_line(msg))
+        tpl = _RIG_PTT_ON_TPL if is_on else _RIG_PTT_OFF_TPL
+        self._safe_send(sender, tpl % epoch_ms_times_1000())
 
     # --- Message handling ---
 
     def _handle_message(self, iface_name: str, msg: dict[str, Any]) -> None:
         mtype = msg.get("type", "")
-        if mtype == "STATION.GET_CALLSIGN":
-            self._on_get_callsign(iface_name, msg)
-        elif mtype == "RIG.GET_FREQ":
-            self._on_get_freq(iface_name, msg)
-        elif mtype == "RIG.SET_FREQ":
-            self._on_set_freq(iface_name, msg)
-        elif mtype == "TX.SEND_MESSAGE":
-            self._on_tx_send_message(iface_name, msg)
-        else:
-            # requirement: log unknown types and continue
-            log.debug("%s unknown message type %r ignored.", iface_name, mtype)
+        # A non-string type (e.g. a JSON list) cannot be a dict key; treat it as unknown
+        handler = self._handlers.get(mtype) if isinstance(mtype, str) else None
+        (handler or self._on_unknown)(iface_name, msg)
+
+    def _on_unknown(self, iface_name: str, msg: dict[str, Any]) -> None:
+        # requirement: log unknown types and continue
+        log.debug("%s unknown message type %r ignored.", iface_name, msg.get("type", ""))
 
     def _on_get_callsign(self, iface_name: str, msg: dict[str, Any]) -> None:
         iface = self.interfaces[iface_name]
         req_params = msg.get("params") or {}
         _id = req_params.get("_ID")
 
-        resp = {
-            "params": {"_ID": _id},
-            "type": "STATION.CALLSIGN",
-            "value": iface.callsign,
-        }
-        self._safe_send(iface, to_json_line(resp))
+        self._safe_send(iface, _CALLSIGN_TPL % (to_json(_id), iface.callsign_json))
 
     def _on_get_freq(self, iface_name: str, msg: dict[str, Any]) -> None:
         """
@@ -241,20 +339,7 @@ class JS8EmuServer:
         req_params = msg.get("params") or {}
         _id = req_params.get("_ID")
 
-        dial = iface.frequency
-        offset = iface.offset
-
-        resp = {
-            "params": {
-                "DIAL": dial,
-                "FREQ": dial + offset,
-                "OFFSET": offset,
-                "_ID": _id,
-            },
-            "type": "RIG.FREQ",
-            "value": "",
-        }
-        self._safe_send(iface, to_json_line(resp))
+        self._safe_send(iface, _RIG_FREQ_TPL % (iface.freq_params, to_json(_id)))
 
     def _on_set_freq(self, iface_name: str, msg: dict[str, Any]) -> None:
         iface = self.interfaces[iface_name]
@@ -266,25 +351,15 @@ class JS8EmuServer:
             log.warning("%s RIG.SET_FREQ invalid DIAL=%r ignored.", iface_name, dial)
             return
 
-        iface.frequency = new_freq
+        with self._by_freq_lock:
+            if iface.is_connected():
+                self._leave_bucket(iface.frequency, iface_name)
+                self._by_freq[new_freq].add(iface_name)
+            iface.set_frequency(new_freq)
         self._emit_station_status(iface)
 
     def _emit_station_status(self, iface: InterfaceState) -> None:
-        dial = iface.frequency
-        offset = iface.offset
-        status = {
-            "params": {
-                "DIAL": dial,
-                "FREQ": dial + offset,
-                "OFFSET": offset,
-                "SELECTED": "",
-                "SPEED": 1,
-                "_ID": str(station_status_id()),
-            },
-            "type": "STATION.STATUS",
-            "value": "",
-        }
-        self._safe_send(iface, to_json_line(status))
+        self._safe_send(iface, _STATION_STATUS_TPL % (iface.freq_params, station_status_id()))
 
     def _on_tx_send_message(self, sender_iface_name: str, msg: dict[str, Any]) -> None:
         sender = self.interfaces[sender_iface_name]
@@ -297,7 +372,7 @@ class JS8EmuServer:
 
         # Spec: JS8Emu MUST prefix the payload with the sending interface callsign, colon, and space.
         # If the client already provided the prefix, do not duplicate it.
-        prefix = f"{sender.callsign}: "
+        prefix = sender.callsign_prefix
         full_payload = payload if payload.startswith(prefix) else f"{prefix}{payload}"
 
         fragments = fragment_text(full_payload, self.cfg.general.fragment_size)
@@ -305,12 +380,11 @@ class JS8EmuServer:
             return
 
         # Determine recipients: same frequency, connected, not the sender
-        recipients = [
-            iface for iface in self.interfaces.values()
-            if iface.name != sender.name
-            and iface.frequency == sender.frequency
-            and iface.is_connected()
-        ]
+        with self._by_freq_lock:
+            recipients = [
+                self.interfaces[name] for name in self._by_freq.get(sender.frequency, ())
+                if name != sender.name
+            ]
         if not recipients:
             return
 
@@ -320,6 +394,7 @@ class JS8EmuServer:
         def tx_task() -> None:
             # We'll send RIG.PTT to the sender, then RX.ACTIVITY fragments to all
             # recipients on the same frequency, then RX.DIRECTED + RX.SPOT.
+            aborted = False
 
             def on_wait_start(_i: int, _frag: str) -> None:
                 self._emit_rig_ptt(sender, is_on=True)
@@ -328,12 +403,14 @@ class JS8EmuServer:
                 self._emit_rig_ptt(sender, is_on=False)
 
             def on_abort(_i: int, _frag: str) -> None:
+                nonlocal aborted
+                aborted = True
                 # Ensure we don't leave the application thinking PTT is still on.
                 self._emit_rig_ptt(sender, is_on=False)
 
             def send_fragment(_i: int, frag: str) -> None:
-                for r in recipients:
-                    self._emit_rx_activity(receiver=r, frag=frag)
+                # One timestamp per frame: every recipient hears the frame at the same moment
+                self._emit_rx_activity(recipients, frag=frag, utc=epoch_ms_times_1000())
 
             self.scheduler.run_frame_sequence(
                 fragments,
@@ -343,35 +420,29 @@ class JS8EmuServer:
                 on_abort=on_abort,
                 send_fragment=send_fragment,
             )
+            if aborted:
+                # The message was never fully delivered
+                return
 
             # After full message delivered, emit RX.DIRECTED + RX.SPOT (single write)
+            utc = epoch_ms_times_1000()
             for r in recipients:
-                self._emit_rx_directed_and_spot(sender=sender, receiver=r, original_text=full_payload)
+                self._emit_rx_directed_and_spot(sender=sender, receiver=r, original_text=full_payload, utc=utc)
 
         self.scheduler.run_in_thread(tx_task, name=f"tx-{sender.callsign}-{epoch_ms_times_1000()}")
 
     # --- RX emission ---
 
-    def _emit_rx_activity(self, receiver: InterfaceState, frag: str) -> None:
-        dial = receiver.frequency
-        offset = receiver.offset
-        msg = {
-            "params": {
-                "DIAL": dial,
-                "FREQ": dial + offset,
-                "OFFSET": offset,
-                "SNR": rand_snr(),
-                "SPEED": 1,
-                "TDRIFT": rand_tdrift(),
-                "UTC": epoch_ms_times_1000(),
-                "_ID": -1,
-            },
-            "type": "RX.ACTIVITY",
-            "value": frag,
-        }
-        self._safe_send(receiver, to_json_line(msg))
+    def _emit_rx_activity(self, receivers: list[InterfaceState], frag: str, utc: int) -> None:
+        # The fragment is encoded once per frame; SNR and TDRIFT stay per receiver.
+        value = to_json(frag)
+        for r in receivers:
+            payload = _RX_ACTIVITY_TPL % (r.freq_params, rand_snr(), to_json(rand_tdrift()), utc, value)
+            self._safe_send(r, payload)
 
-    def _emit_rx_directed_and_spot(self, sender: InterfaceState, receiver: InterfaceState, original_text: str) -> None:
+    def _emit_rx_directed_and_spot(
+        self, sender: InterfaceState, receiver: InterfaceState, original_text: str, utc: int
+    ) -> None:
         # Spec: append five bytes " \xe2\x99\xa2 " which is " ♢ " (space diamond space)
         suffix = " ♢ "
         text = f"{original_text}{suffix}"
@@ -382,44 +453,13 @@ class JS8EmuServer:
         dial = receiver.frequency
         offset = receiver.offset
         snr = rand_snr()
-        tdrift = rand_tdrift()
-        utc = epoch_ms_times_1000()
-
-        directed = {
-            "params": {
-                "CMD": " ",
-                "DIAL": dial,
-                "EXTRA": "",
-                "FREQ": dial + offset,
-                "FROM": sender.callsign,
-                "GRID": "",
-                "OFFSET": offset,
-                "SNR": snr,
-                "SPEED": 1,
-                "TDRIFT": tdrift,
-                "TEXT": text,
-                "TO": to_call,
-                "UTC": utc,
-                "_ID": -1,
-            },
-            "type": "RX.DIRECTED",
-            "value": text,
-        }
+        text_json = to_json(text)
 
-        spot = {
-            "params": {
-                "CALL": sender.callsign,
-                "DIAL": dial,
-                "FREQ": dial + offset,
-                "GRID": sender.maidenhead,
-                "OFFSET": offset,
-                "SNR": snr,
-                "_ID": -1,
-            },
-            "type": "RX.SPOT",
-            "value": "",
-        }
+        directed = _RX_DIRECTED_TPL % (
+            dial, dial + offset, sender.callsign_json, offset, snr,
+            to_json(rand_tdrift()), text_json, to_json(to_call), utc, text_json,
+        )
+        spot = _RX_SPOT_TPL % (sender.callsign_json, dial, dial + offset, sender.maidenhead_json, offset, snr)
 
-        payload = to_json_line(directed) + to_json_line(spot)  # must be one TCP send
         log.info(f"SEND -> {to_call}: {text}")
-        self._safe_send(receiver, payload)
+        self._safe_send(receiver, [directed, spot])  # must be one TCP send
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import random
+import threading
 import time
 
+# One generator per thread (TX tasks run on pool threads) rather than the shared
+# module-level instance; each is seeded independently from os.urandom.
+_tls = threading.local()
+
+
+def _rng() -> random.Random:
+    r = getattr(_tls, "rng", None)
+    if r is None:
+        r = _tls.rng = random.Random()
+    return r
+
 
 def epoch_ms_times_1000() -> int:
     # Spec: "current epoch time in milliseconds multiplied by 1000"
-    ms = int(time.time() * 1000)
-    return ms * 1000
+    return time.time_ns() // 1_000_000 * 1000
 
 
 def station_status_id() -> int:
@@ -16,9 +27,9 @@ def station_status_id() -> int:
 
 
 def rand_snr() -> int:
-    return random.randint(-20, 20)
+    return _rng().randint(-20, 20)
 
 
 def rand_tdrift() -> float:
     # random float -2..+2
-    return random.uniform(-2.0, 2.0)
+    return _rng().uniform(-2.0, 2.0)